@@ -1,9 +1,13 @@
 ### Initial imports
-import json
+import orjson
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import locale
 
+from fig_helpers import derive_bias, plot_series
+
 
 ### Load data
 
@@ -13,19 +17,15 @@ file_name_3 = "d_at_spec_point_1000eta_run.json"
 data = []
 
 
-with open(file_name_1, "r", encoding="utf-8") as file:
-    for line in file:
-        data.append(json.loads(line.removesuffix('\n')))
+for file_name in (file_name_1, file_name_2, file_name_3):
+    with open(file_name, "rb") as file:
+        data.extend(orjson.loads(line) for line in file.read().split(b"\n") if line)
 
-with open(file_name_2, "r", encoding="utf-8") as file:
-    for line in file:
-        data.append(json.loads(line.removesuffix('\n')))
+### Perform analysis and plots
 
-with open(file_name_3, "r", encoding="utf-8") as file:
-    for line in file:
-        data.append(json.loads(line.removesuffix('\n')))
+def derive_label(error_model):
+    return f"$\eta$={derive_bias(error_model)}"
 
-### Perform analysis and plots
 
 # recover the number of runs per probability, error model, and decoder (assume the same for all)
 # runs_per_prob = data[0]['n_run']
@@ -56,9 +56,7 @@ plt.xlim(d_min-1, d_max+1)
 plt.ylim(0.45, 0.6)
 
 # add data
-for error_model, xys in xy_map.items():
-    legend_label = f"$\eta${error_model[25:-11]}"
-    plt.plot(*zip(*xys), 'x-', label=legend_label)
+plot_series(xy_map, derive_label, 'x-')
 plt.legend(loc='upper left', fontsize=11)
 plt.xticks(np.arange(3,21,2))
 plt.grid()
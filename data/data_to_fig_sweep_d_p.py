@@ -1,8 +1,12 @@
 ### Initial imports
-import json
+import orjson
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import locale
 
+from fig_helpers import plot_series
+
 
 ### Load data
 
@@ -11,19 +15,16 @@ file_name_2 = "night_run_2.json"
 file_name_3 = "d_at_spec_point_30eta_run.json"
 data = []
 
-with open(file_name_1, "r", encoding="utf-8") as file:
-    for line in file:
-        data.append(json.loads(line.removesuffix('\n')))
+for file_name in (file_name_1, file_name_2, file_name_3):
+    with open(file_name, "rb") as file:
+        data.extend(orjson.loads(line) for line in file.read().split(b"\n") if line)
 
-with open(file_name_2, "r", encoding="utf-8") as file:
-    for line in file:
-        data.append(json.loads(line.removesuffix('\n')))
+### Perform analysis and plots
 
-with open(file_name_3, "r", encoding="utf-8") as file:
-    for line in file:
-        data.append(json.loads(line.removesuffix('\n')))
+# code labels are of the form "Rotated planar G81 (XZXZ/ZXZX), d = 3"
+def derive_label(code):
+    return f"${code.rsplit(', ', 1)[-1]}$"
 
-### Perform analysis and plots
 
 # recover the number of runs per probability, error model, and decoder (assume the same for all)
 runs_per_prob = data[0]['n_run']
@@ -53,9 +54,7 @@ plt.xlim(error_probability_min-0.05, error_probability_max+0.05)
 plt.ylim(-0.05, 0.65)
 
 # add data
-for code, xys in xy_map.items():
-    legend_label = f"${code[31:]}$"
-    plt.plot(*zip(*xys), 'x-', label=legend_label)
+plot_series(xy_map, derive_label, 'x-')
 plt.legend(loc='upper left', fontsize=11)
 plt.grid()
 plt.savefig("eta30_d_3to17_p_zerotospecialpoint_svenska.png")
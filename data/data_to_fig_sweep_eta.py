@@ -1,9 +1,13 @@
 ### Initial imports
-import json
+import orjson
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import numpy as np
 import locale
 
+from fig_helpers import derive_bias, plot_series
+
 ### Analytical solution
 
 def h_g81(x):
@@ -36,12 +40,16 @@ probability_values_XZZX = t_XZZX(eta_values)
 file_name_1 = "eta_run_3.json"
 data = []
 
-with open(file_name_1, "r", encoding="utf-8") as file:
-    for line in file:
-        data.append(json.loads(line.removesuffix('\n')))
+with open(file_name_1, "rb") as file:
+    data.extend(orjson.loads(line) for line in file.read().split(b"\n") if line)
 
 ### Perform analysis and plots
 
+# code labels are of the form "Rotated planar G81 (XZXZ/ZXZX), d = 3"
+def derive_label(code):
+    return f"{code.split()[2]} simulerad"
+
+
 # recover the number of runs per probability, error model, and decoder (assume the same for all)
 runs_per_eta = data[0]['n_run']
 decoder = data[0]['decoder']
@@ -52,8 +60,7 @@ decoder = data[0]['decoder']
 xy_map = {}
 for run in data:
     xys = xy_map.setdefault(run['code'], [])
-    error_model = run['error_model']
-    bias = float(error_model[26: -11])
+    bias = float(derive_bias(run['error_model']))
     xys.append((bias, run['logical_failure_rate']))
 
 # format plot
@@ -71,10 +78,7 @@ plt.xlim(eta_min-5, 500+5)
 plt.ylim(0.45, 0.75)
 
 # add data
-for code, xys in xy_map.items():
-    legend_label = f"{code[15:18]} simulerad"
-    
-    plt.plot(*zip(*xys), label=legend_label)
+plot_series(xy_map, derive_label)
 
 plt.plot(eta_values, probability_values_g81, label="$G81$ analytisk")
 plt.plot(eta_values, probability_values_XZZX, c="r", label="$XZZX$ analytisk")
@@ -0,0 +1,41 @@
+import re
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+# error model labels are of the form "Biased-depolarizing (bias=30, axis='Z')", where the bias may also be formatted as
+# a NumPy scalar, e.g. "bias=np.float64(30.0)"
+_bias_pattern = re.compile(r"bias=(?:np\.float64\()?([^,)]+)")
+
+
+def derive_bias(error_model):
+    """
+    Return the bias of the error model label as a string.
+
+    :param error_model: Error model label.
+    :type error_model: str
+    :return: Bias.
+    :rtype: str
+    """
+    return _bias_pattern.search(error_model).group(1)
+
+
+def plot_series(xy_map, derive_label, *fmt):
+    """
+    Plot each series of (x, y) in the map, labelled by the label derived from its key, with a single plot call if all
+    series share the same x values.
+
+    :param xy_map: Map of key to series of (x, y).
+    :type xy_map: dict of key to list of (float, float)
+    :param derive_label: Function returning the legend label of a key.
+    :type derive_label: function
+    :param fmt: Optional format string passed to :func:`matplotlib.pyplot.plot`, e.g. 'x-'.
+    :type fmt: str
+    """
+    series = [np.asarray(xys) for xys in xy_map.values()]
+    legend_labels = [derive_label(key) for key in xy_map]
+    if all(np.array_equal(xys[:, 0], series[0][:, 0]) for xys in series):
+        plt.plot(series[0][:, 0], np.column_stack([xys[:, 1] for xys in series]), *fmt, label=legend_labels)
+    else:
+        for xys, legend_label in zip(series, legend_labels):
+            plt.plot(xys[:, 0], xys[:, 1], *fmt, label=legend_label)
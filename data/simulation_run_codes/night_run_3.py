@@ -1,10 +1,13 @@
 # Imports
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import collections
 import itertools
 from datetime import datetime
-import json
+import orjson
 
 from qecsim import paulitools as pt
 from qecsim.models.generic import DepolarizingErrorModel, BiasedDepolarizingErrorModel
@@ -16,13 +19,22 @@ from qecsim import app
 import RotatedPlanarG81Code as G81Code
 import RotatedPlanarG81Pauli as G81Pauli
 import RotatedPlanarG81RMPSDecoder as G81RMPSDecoder
+from batch_run import BatchedBiasedDepolarizingErrorModel
+
+
+def _run_one(params):
+    """Run simulations for one (code, error model, decoder, error probability, max runs) and return the result as a
+    dictionary."""
+    code, error_model, decoder, error_probability, max_runs = params
+    return app.run(code, error_model, decoder, error_probability, max_runs=max_runs)
 
 
 ### Preparing simulations 
 
 # Surface codes, error model and decoder type to use
 codes = [G81Code.RotatedPlanarG81Code(d) for d in [19, 21, 23, 25, 27, 29]]
-error_model = BiasedDepolarizingErrorModel(bias = 30, axis='Z')
+eta = 30
+error_model = BatchedBiasedDepolarizingErrorModel(bias=eta, axis='Z')
 decoder = G81RMPSDecoder.RotatedPlanarG81RMPSDecoder(chi=8) 
 
 # Define the range for the physical error to simulate for
@@ -36,28 +48,29 @@ error_probabilities = np.linspace(error_probability_min, error_probability_max,
 max_runs = 10000
 
 
-# Print run parameters prior to run
-print('Codes:', [code.label for code in codes])
-print('Error model:', error_model.label)
-print('Decoder:', decoder.label)
-print('Error probabilities:', error_probabilities)
-print('Maximum runs:', max_runs)
+if __name__ == '__main__':
 
+    # Print run parameters prior to run
+    print('Codes:', [code.label for code in codes])
+    print('Error model:', error_model.label)
+    print('Decoder:', decoder.label)
+    print('Error probabilities:', error_probabilities)
+    print('Maximum runs:', max_runs)
 
-# Run simulations and store the result as a list of dictionaries
-data = [app.run(code, error_model, decoder, error_probability, max_runs=max_runs) 
-        for code in codes for error_probability in error_probabilities]
 
+    # Run simulations in parallel over codes and save each result to file in json format as it is returned (in order)
 
-### Save data to file in json format, named with the current datetime
+    params = [(code, error_model, decoder, error_probability, max_runs)
+              for code in codes for error_probability in error_probabilities]
 
-time_now = str(datetime.now())
+    time_now = str(datetime.now())
 
-#with open(f"simulation_{time_now}_data.json", "w", encoding="utf-8") as file:
-with open(f"night_run_3.json", "w", encoding="utf-8") as file:
-    for entry in data:
-        file.write(json.dumps(entry))
-        file.write("\n")
+    #with open(f"simulation_{time_now}_data.json", "wb") as file:
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor, \
+            open(f"night_run_3.json", "wb") as file:
+        for entry in executor.map(_run_one, params):
+            file.write(orjson.dumps(entry, option=orjson.OPT_SERIALIZE_NUMPY))
+            file.write(b"\n")
 
 
 
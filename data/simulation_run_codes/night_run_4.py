@@ -4,7 +4,7 @@ import numpy as np
 import collections
 import itertools
 from datetime import datetime
-import json
+import orjson
 
 from qecsim import paulitools as pt
 from qecsim.models.generic import DepolarizingErrorModel, BiasedDepolarizingErrorModel
@@ -53,11 +53,11 @@ data = [app.run(code, error_model, decoder, error_probability, max_runs=max_runs
 
 time_now = str(datetime.now())
 
-#with open(f"simulation_{time_now}_data.json", "w", encoding="utf-8") as file:
-with open(f"night_run_4.json", "w", encoding="utf-8") as file:
+#with open(f"simulation_{time_now}_data.json", "wb") as file:
+with open(f"night_run_4.json", "wb") as file:
     for entry in data:
-        file.write(json.dumps(entry))
-        file.write("\n")
+        file.write(orjson.dumps(entry, option=orjson.OPT_SERIALIZE_NUMPY))
+        file.write(b"\n")
 
 
 
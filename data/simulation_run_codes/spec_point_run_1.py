@@ -4,7 +4,7 @@ import numpy as np
 import collections
 import itertools
 from datetime import datetime
-import json
+import orjson
 
 from qecsim import paulitools as pt
 from qecsim.models.generic import DepolarizingErrorModel, BiasedDepolarizingErrorModel
@@ -16,6 +16,7 @@ from qecsim import app
 import RotatedPlanarG81Code as G81Code
 import RotatedPlanarG81Pauli as G81Pauli
 import RotatedPlanarG81RMPSDecoder as G81RMPSDecoder
+from batch_run import batch_run
 
 
 ### Preparing simulations 
@@ -46,11 +47,8 @@ print('Maximum runs:', max_runs)
 
 # Run simulations and store the result as a list of dictionaries
 
-data = []
-for eta in eta_vec:
-    error_model = BiasedDepolarizingErrorModel(bias=eta, axis='Z')
-    error_probability = (1 + 1/eta) / (2 + 1/eta)
-    data.append(app.run(code, error_model, decoder, error_probability, max_runs=max_runs))
+params_list = [(eta, (1 + 1/eta) / (2 + 1/eta)) for eta in eta_vec]
+data = batch_run(code, decoder, params_list, max_runs)
 
 #data = [app.run(code, error_model, decoder, error_probability, max_runs=max_runs) 
 #        for code in codes for error_probability in error_probabilities]
@@ -60,11 +58,11 @@ for eta in eta_vec:
 
 time_now = str(datetime.now())
 
-#with open(f"simulation_{time_now}_data.json", "w", encoding="utf-8") as file:
-with open(f"eta_run_1.json", "w", encoding="utf-8") as file:
+#with open(f"simulation_{time_now}_data.json", "wb") as file:
+with open(f"eta_run_1.json", "wb") as file:
     for entry in data:
-        file.write(json.dumps(entry))
-        file.write("\n")
+        file.write(orjson.dumps(entry, option=orjson.OPT_SERIALIZE_NUMPY))
+        file.write(b"\n")
 
 
 
@@ -1,10 +1,13 @@
 # Imports
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import collections
 import itertools
 from datetime import datetime
-import json
+import orjson
 
 from qecsim import paulitools as pt
 from qecsim.models.generic import DepolarizingErrorModel, BiasedDepolarizingErrorModel
@@ -16,6 +19,14 @@ from qecsim import app
 import RotatedPlanarG81Code as G81Code
 import RotatedPlanarG81Pauli as G81Pauli
 import RotatedPlanarG81RMPSDecoder as G81RMPSDecoder
+from batch_run import batch_run
+
+
+def _run_batch(params):
+    """Run simulations for one (code, decoder, list of (eta, error probability), max runs) and return the results as a
+    list of dictionaries, sharing the code and decoder across the batch."""
+    code, decoder, params_list, max_runs = params
+    return batch_run(code, decoder, params_list, max_runs)
 
 
 ### Preparing simulations 
@@ -35,36 +46,34 @@ decoder = G81RMPSDecoder.RotatedPlanarG81RMPSDecoder(chi=8)
 max_runs = 80000
 
 
-# Print run parameters prior to run
-#print('Codes:', [code.label for code in codes])
-print('Code:', code.label)
-print('Error model: (eta : 1-1000)', error_model.label)
-print('Decoder:', decoder.label)
-print('Error probabilities: (p_s)')
-print('Maximum runs:', max_runs)
-
-
-# Run simulations and store the result as a list of dictionaries
+if __name__ == '__main__':
 
-data = []
-for eta in eta_vec:
-    error_model = BiasedDepolarizingErrorModel(bias=eta, axis='Z')
-    error_probability = (1 + 1/eta) / (2 + 1/eta)
-    data.append(app.run(code, error_model, decoder, error_probability, max_runs=max_runs))
+    # Print run parameters prior to run
+    #print('Codes:', [code.label for code in codes])
+    print('Code:', code.label)
+    print('Error model: (eta : 1-1000)', error_model.label)
+    print('Decoder:', decoder.label)
+    print('Error probabilities: (p_s)')
+    print('Maximum runs:', max_runs)
 
-#data = [app.run(code, error_model, decoder, error_probability, max_runs=max_runs) 
-#        for code in codes for error_probability in error_probabilities]
 
+    # Run simulations in parallel over contiguous batches of eta, sharing the code and decoder within each batch, and
+    # save each result to file in json format as its batch is returned (in order)
 
-### Save data to file in json format, named with the current datetime
+    params_list = [(eta, (1 + 1/eta) / (2 + 1/eta)) for eta in eta_vec]
+    n_batches = min(len(params_list), 4 * os.cpu_count())
+    params = [(code, decoder, [params_list[i] for i in batch], max_runs)
+              for batch in np.array_split(np.arange(len(params_list)), n_batches)]
 
-time_now = str(datetime.now())
+    time_now = str(datetime.now())
 
-#with open(f"simulation_{time_now}_data.json", "w", encoding="utf-8") as file:
-with open(f"eta_run_3.json", "w", encoding="utf-8") as file:
-    for entry in data:
-        file.write(json.dumps(entry))
-        file.write("\n")
+    #with open(f"simulation_{time_now}_data.json", "wb") as file:
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor, \
+            open(f"eta_run_3.json", "wb") as file:
+        for batch in executor.map(_run_batch, params):
+            for entry in batch:
+                file.write(orjson.dumps(entry, option=orjson.OPT_SERIALIZE_NUMPY))
+                file.write(b"\n")
 
 
 
@@ -1,5 +1,8 @@
+import functools
 import operator
 
+import numpy as np
+
 from qecsim.model import cli_description
 from qecsim.models.rotatedplanar import RotatedPlanarCode
 import RotatedPlanarG81Pauli as G81Pauli
@@ -74,13 +77,16 @@ class RotatedPlanarG81Code(RotatedPlanarCode):
         :raises TypeError: if any parameter is of an invalid type.
         """
         try:  # paranoid checking for CLI. (operator.index ensures the parameter can be treated as an int)
-            if operator.index(distance) < self.MIN_SIZE[0]:
-                raise ValueError('{} minimum distance is {}.'.format(type(self).__name__, self.MIN_SIZE[0]))
-            if distance % 2 == 0:
-                raise ValueError('{} size must be odd.'.format(type(self).__name__))
+            distance = operator.index(distance)
         except TypeError as ex:
             raise TypeError('{} invalid parameter type'.format(type(self).__name__)) from ex
+        if distance < self.MIN_SIZE[0]:
+            raise ValueError('{} minimum distance is {}.'.format(type(self).__name__, self.MIN_SIZE[0]))
+        if not distance & 1:
+            raise ValueError('{} size must be odd.'.format(type(self).__name__))
         super().__init__(distance, distance)
+        # plaquette operators in bsf by plaquette index (see _plaquette_bsf)
+        self._plaquette_bsfs = {}
 
 
     @classmethod
@@ -111,6 +117,106 @@ class RotatedPlanarG81Code(RotatedPlanarCode):
         return y % 2 == 1
 
 
+    @functools.cached_property
+    def _plaquette_index_array(self):
+        """
+        Return the plaquette indices of the lattice as an array, in the same order as :meth:`_plaquette_indices`.
+
+        Notes:
+
+        * The array is built once per code and reused to resolve each syndrome, rather than being rebuilt from the list
+          of plaquette indices on every call.
+
+        :return: Array of indices in the format (x, y).
+        :rtype: numpy.array (2d) of int
+        """
+        plaquette_index_array = np.array(self._plaquette_indices, dtype=int)
+        plaquette_index_array.flags.writeable = False
+        return plaquette_index_array
+
+
+    def _plaquette_bsf(self, index):
+        """
+        Return the plaquette operator at the given index in binary symplectic form, as applied by
+        :meth:`RotatedPlanarG81Pauli.plaquette`.
+
+        Notes:
+
+        * The bsf is built once per code and plaquette, and cached on the code, to be XORed onto Paulis thereafter.
+        * The bsf is the identity for plaquettes that lie outside the lattice.
+
+        :param index: Index identifying the plaquette in the format (x, y).
+        :type index: 2-tuple of int
+        :return: Binary symplectic representation of plaquette operator (read-only).
+        :rtype: numpy.array (1d)
+        """
+        bsf = self._plaquette_bsfs.get(index)
+        if bsf is not None:
+            return bsf
+        x, y = index
+        pauli = self.new_pauli()
+        if self.is_in_plaquette_bounds(index):
+            # SW, NW, NE, SE corners: ZZXX for ZX/ZX, XXZZ for XZ/XZ
+            corners = ((x, y), (x, y + 1), (x + 1, y + 1), (x + 1, y))
+            pauli.sites_bulk(corners, ('Z', 'Z', 'X', 'X') if self.is_zxzx_plaquette(index) else ('X', 'X', 'Z', 'Z'))
+        bsf = pauli.to_bsf().astype(np.uint8)
+        bsf.flags.writeable = False
+        self._plaquette_bsfs[index] = bsf
+        return bsf
+
+
+    @functools.cached_property
+    def _logical_x_bsf(self):
+        """
+        Return the logical X operator in binary symplectic form, as applied by :meth:`RotatedPlanarG81Pauli.logical_x`.
+
+        :return: Binary symplectic representation of logical X operator (read-only).
+        :rtype: numpy.array (1d)
+        """
+        max_site_x, max_site_y = self.site_bounds
+        xs = np.arange(max_site_x + 1)
+        # XZXZ... along the bottom row
+        indices = np.stack((xs, np.zeros_like(xs)), axis=1)
+        bsf = self.new_pauli().sites_bulk(indices, np.where(xs % 2 == 0, 'X', 'Z')).to_bsf().astype(np.uint8)
+        bsf.flags.writeable = False
+        return bsf
+
+
+    @functools.cached_property
+    def _logical_z_bsf(self):
+        """
+        Return the logical Z operator in binary symplectic form, as applied by :meth:`RotatedPlanarG81Pauli.logical_z`.
+
+        :return: Binary symplectic representation of logical Z operator (read-only).
+        :rtype: numpy.array (1d)
+        """
+        max_site_x, max_site_y = self.site_bounds
+        ys = np.arange(max_site_y + 1)
+        # ZZZ... along the rightmost column
+        indices = np.stack((np.full_like(ys, max_site_x), ys), axis=1)
+        bsf = self.new_pauli().sites_bulk(indices, 'Z').to_bsf().astype(np.uint8)
+        bsf.flags.writeable = False
+        return bsf
+
+
+    def syndrome_to_plaquette_index_array(self, syndrome):
+        """
+        Returns the indices of the plaquettes associated with the non-commuting stabilizers identified by the syndrome,
+        as an array.
+
+        :param syndrome: Binary vector identifying commuting and non-commuting stabilizers by 0 and 1 respectively.
+        :type syndrome: numpy.array (1d)
+        :return: Array of plaquette indices in the format (x, y).
+        :rtype: numpy.array (2d) of int
+        """
+        return self._plaquette_index_array[syndrome.nonzero()]
+
+
+    def syndrome_to_plaquette_indices(self, syndrome):
+        """See :meth:`qecsim.models.rotatedplanar.RotatedPlanarCode.syndrome_to_plaquette_indices`"""
+        return set(tuple(index) for index in self.syndrome_to_plaquette_index_array(syndrome))
+
+
     # < StabilizerCode interface methods >
 
     @property
@@ -1,3 +1,5 @@
+import numpy as np
+
 from qecsim.models.rotatedplanar import RotatedPlanarPauli
 
 class RotatedPlanarG81Pauli(RotatedPlanarPauli): 
@@ -17,6 +19,58 @@ class RotatedPlanarG81Pauli(RotatedPlanarPauli):
     * Convert to binary symplectic form: :meth:`to_bsf`.
     * Copy a rotated planar Pauli G81 operator: :meth:`copy`.
     """
+    def sites_bulk(self, indices, operators):
+        """
+        Apply the operators to the sites identified by the indices, equivalent to calling :meth:`site` for each pair.
+
+        Notes:
+
+        * Indices are in the format (x, y).
+        * Operators applied to the same site more than once are combined, as with repeated calls to :meth:`site`.
+        * Applying operators on sites that lie outside the lattice have no effect on the lattice.
+
+        :param indices: Indices identifying sites in the format (x, y).
+        :type indices: numpy.array (2d) of int with shape (k, 2)
+        :param operators: Pauli operator for each index, or a single Pauli operator for all indices. One of 'I', 'X',
+            'Y', 'Z'.
+        :type operators: numpy.array (1d) of str or str
+        :return: self (to allow chaining)
+        :rtype: RotatedPlanarG81Pauli
+        """
+        indices = np.asarray(indices, dtype=int).reshape(-1, 2)
+        operators = np.broadcast_to(operators, len(indices))
+        # keep only indices within lattice
+        xs, ys = indices.T
+        max_site_x, max_site_y = self.code.site_bounds
+        in_bounds = (0 <= xs) & (xs <= max_site_x) & (0 <= ys) & (ys <= max_site_y)
+        rows, cols = self.code.size
+        flat_indices = (xs + ys * cols)[in_bounds]
+        operators = operators[in_bounds]
+        # flip sites, counting flips per site so that repeated operators cancel
+        n_qubits = len(self._xs)
+        x_flips = np.bincount(flat_indices[np.isin(operators, ('X', 'Y'))], minlength=n_qubits) % 2
+        z_flips = np.bincount(flat_indices[np.isin(operators, ('Z', 'Y'))], minlength=n_qubits) % 2
+        self._xs ^= x_flips.astype(self._xs.dtype)
+        self._zs ^= z_flips.astype(self._zs.dtype)
+        return self
+
+
+    def _xor_bsf(self, bsf):
+        """
+        Apply the operator given in binary symplectic form, i.e. XOR it onto this Pauli.
+
+        :param bsf: Binary symplectic representation of Pauli.
+        :type bsf: numpy.array (1d)
+        :return: self (to allow chaining)
+        :rtype: RotatedPlanarG81Pauli
+        """
+        n_qubits = len(self._xs)
+        # cast to the dtype of this Pauli, which may be backed by e.g. a bool bsf
+        self._xs ^= bsf[:n_qubits].astype(self._xs.dtype, copy=False)
+        self._zs ^= bsf[n_qubits:].astype(self._zs.dtype, copy=False)
+        return self
+
+
     def plaquette(self, index): 
         """
         Apply a plaquette operator at the given index.
@@ -29,33 +83,15 @@ class RotatedPlanarG81Pauli(RotatedPlanarPauli):
         * If an XZ/XZ-type plaquette is indexed (i.e. y % 2 == 1), then X operators are applied in the NW and SW 
           corners of the plaquette, and Z operators are applied in the NE and SE corners of the plaquette.
         * Applying plaquette operators on plaquettes that lie outside the lattice have no effect on the lattice.
+        * The plaquette operator is cached per code in binary symplectic form (see
+          :meth:`RotatedPlanarG81Code._plaquette_bsf`), and XORed onto this Pauli.
 
         :param index: Index identifying the plaquette in the location format (x, y).
         :type index: 2-tuple of int
         :return: self (to allow chaining)
         :rtype: RotatedPlanarPauli
         """
-        x, y = index
-        # apply if index within lattice
-        if self.code.is_in_plaquette_bounds(index):
-
-            # if ZX/ZX
-            if (y % 2 == 0): 
-                # flip plaquette sites
-                self.site('Z', (x, y)) # SW
-                self.site('Z', (x, y + 1)) # NW
-                self.site('X', (x + 1, y + 1)) # NE
-                self.site('X', (x + 1, y)) # SE
-
-            # if XZ/XZ
-            else:
-                # flip plaquette sites
-                self.site('X', (x, y)) # SW
-                self.site('X', (x, y + 1)) # NW
-                self.site('Z', (x + 1, y + 1)) # NE
-                self.site('Z', (x + 1, y)) # SE
-
-        return self
+        return self._xor_bsf(self.code._plaquette_bsf(tuple(index)))
 
 
     def logical_x(self): 
@@ -69,15 +105,7 @@ class RotatedPlanarG81Pauli(RotatedPlanarPauli):
         :return: self (to allow chaining)
         :rtype: RotatedPlanarG81Pauli
         """
-
-        max_site_x, max_site_y = self.code.site_bounds
-        for x in range(0, max_site_x + 1):
-            if x % 2 == 0:
-                self.site('X', (x, 0))
-            else:
-                self.site('Z', (x, 0))
-
-        return self
+        return self._xor_bsf(self.code._logical_x_bsf)
 
 
     def logical_z(self): 
@@ -91,11 +119,7 @@ class RotatedPlanarG81Pauli(RotatedPlanarPauli):
         :return: self (to allow chaining)
         :rtype: RotatedPlanarG81Pauli
         """
-        
-        max_site_x, max_site_y, = self.code.site_bounds
-        self.site('Z', *((max_site_x, y) for y in range(0, max_site_y + 1)))
-
-        return self
+        return self._xor_bsf(self.code._logical_z_bsf)
 
 
     # String representation of the class
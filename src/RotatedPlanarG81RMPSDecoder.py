@@ -1,19 +1,280 @@
+import collections
 import functools
 import itertools
 import json
 import logging
-import operator
 
 import numpy as np
-from mpmath import mp
+from scipy import linalg as sp_linalg
 
 from qecsim import paulitools as pt, tensortools as tt
-from qecsim.model import Decoder, cli_description
-from qecsim.models.generic import DepolarizingErrorModel
+from qecsim.model import cli_description
 from qecsim.models.rotatedplanar import RotatedPlanarRMPSDecoder
 
 logger = logging.getLogger(__name__)
 
+# normalised singular values not greater than this cutoff are discarded in truncation (see TNC.truncate)
+_SVD_CUTOFF = 1e-14
+
+# float32 log coset probabilities closer than this to the maximum are recontracted in float64 (see
+# RotatedPlanarG81RMPSDecoder._coset_probabilities), as float32 rounding drifts them by up to a few 1e-5
+_FLOAT32_LOG_GAP = 1e-3
+
+# structural plan for creating a q-node (see _q_plan)
+_QPlan = collections.namedtuple('_QPlan', 'even_column table_axes q_shape node_shape node_index shape')
+
+
+@functools.lru_cache(maxsize=1024)
+def _quantize(prob_dist, digits=12):
+    """
+    Return probability distribution with each probability rounded to the given number of significant digits.
+
+    Notes:
+
+    * Used to key the tensor network creator caches, so that probability distributions that are equal up to rounding
+      share cached q-nodes, e.g. when the same error model and probability are rebuilt for each run of a sweep.
+    * Results are cached, so equal probability distributions are interned as the same tuple, which is then matched by
+      identity rather than by element-wise comparison on each lookup in the tensor network creator caches.
+
+    :param prob_dist: Probability distribution in the format (Pr(I), Pr(X), Pr(Y), Pr(Z)).
+    :type prob_dist: (float, float, float, float)
+    :param digits: Number of significant digits. (default=12)
+    :type digits: int
+    :return: Quantized probability distribution.
+    :rtype: (float, float, float, float)
+    """
+    return tuple(float('{:.{}g}'.format(p, digits)) for p in prob_dist)
+
+
+@functools.lru_cache()
+def _pauli_index_table(even_column):
+    """Return index (in order I, X, Y, Z) of the Pauli on a horizontal edge, indexed by (f, n, e, s, w).
+
+    Notes:
+
+    * The index table is independent of the probability distribution, so it is built once for each column parity
+      and a value table for a new probability distribution is a single gather (see :func:`_full_table`).
+    """
+    paulis = ('I', 'X', 'Y', 'Z')
+    pauli_bsfs = pt.pauli_to_bsf(paulis)
+    I, X, Y, Z = pauli_bsfs
+    # ops[f, n, e, s, w] is bsf of f with n, e, s, w in {0, 1} turning on or off the operator on each leg
+    ops = pauli_bsfs.reshape(4, 1, 1, 1, 1, 2)
+    leg_ops = (Z, X, Z, X) if even_column else (X, Z, X, Z)
+    for axis, leg_op in enumerate(leg_ops, start=1):
+        shape = [1, 1, 1, 1, 1, 2]
+        shape[axis] = 2
+        ops = ops + np.stack((I, leg_op)).reshape(shape)
+    ops %= 2
+    # map bsf (x, z) to index in paulis
+    pauli_index = np.array([[0, 3], [1, 2]])
+    index_table = pauli_index[ops[..., 0], ops[..., 1]]
+    index_table.flags.writeable = False
+    return index_table
+
+
+@functools.lru_cache()
+def _full_table(prob_dist, even_column, dtype):
+    """Return horizontal edge tensor element values indexed by (f, n, e, s, w), with f in order I, X, Y, Z.
+
+    :param prob_dist: Probability distribution in the format (Pr(I), Pr(X), Pr(Y), Pr(Z)).
+    :type prob_dist: (float, float, float, float)
+    :param even_column: If even column, else odd column.
+    :type even_column: bool
+    :param dtype: Data type of values.
+    :type dtype: numpy.dtype
+    :return: Value table.
+    :rtype: numpy.array (5d)
+    """
+    table = np.asarray(prob_dist, dtype=dtype)[_pauli_index_table(even_column)]
+    table.flags.writeable = False
+    return table
+
+
+@functools.lru_cache(maxsize=None)
+def _q_plan(h_node, even_column, compass_direction=None):
+    """Return structural plan for creating q-node, independent of probability distribution and Pauli.
+
+    See :meth:`RotatedPlanarG81RMPSDecoder.TNC.create_q_node` for parameters.
+
+    :return: Q-node plan.
+    :rtype: _QPlan
+    """
+
+    # H indicates h-node with shape (n,e,s,w).
+    # * indicates delta nodes with shapes (n,I,j), (e,J,k), (s,K,l), (w,L,i) for n-, e-, s-, and w-deltas
+    #   respectively.
+    # n,e,s,w,i,j,k,I,J,K are bond labels
+    #
+    #   i     I
+    #   |     |
+    # L-*     *-j
+    #    \   /
+    #    w\ /n
+    #      H
+    #    s/ \e
+    #    /   \
+    # l-*     *-J
+    #   |     |
+    #   K     k
+    #
+    # Deltas are absorbed into h-node over n,e,s,w legs and reshaped as follows:
+    # nesw -> (iI)(jJ)(Kk)(Ll)
+
+    # define shapes # q_node:(n, e, s, w); delta_nodes: n:(n,I,j), e:(e,J,k), s:(s,K,l), w:(w,L,i)
+    if h_node:
+        # bulk h-node
+        q_shape = (2, 2, 2, 2)
+        if even_column:
+            n_shape, e_shape, s_shape, w_shape = (2, 2, 2), (2, 1, 2), (2, 2, 2), (2, 1, 2)
+        else:
+            n_shape, e_shape, s_shape, w_shape = (2, 2, 1), (2, 2, 2), (2, 2, 1), (2, 2, 2)
+        # modifications for directions
+        if compass_direction == 'n':
+            q_shape = (2, 2, 2, 1)
+            n_shape, w_shape = (2, 1, 2), (1, 1, 1)
+        elif compass_direction == 'ne':
+            q_shape = (1, 2, 2, 1)
+            n_shape, e_shape, w_shape = (1, 1, 1), (2, 1, 2), (1, 1, 1)
+        elif compass_direction == 'e':
+            q_shape = (1, 2, 2, 2)
+            n_shape, e_shape = (1, 1, 1), (2, 1, 2)
+        elif compass_direction == 'se':  # always even
+            q_shape = (1, 1, 2, 2)
+            n_shape, e_shape, s_shape = (1, 1, 1), (1, 1, 1), (2, 1, 2)
+        elif compass_direction == 's':  # always even
+            q_shape = (2, 1, 2, 2)
+            e_shape, s_shape = (1, 1, 1), (2, 1, 2)
+        elif compass_direction == 'sw':  # always even
+            q_shape = (2, 1, 1, 2)
+            e_shape, s_shape, w_shape = (1, 1, 1), (1, 1, 1), (2, 1, 2)
+        elif compass_direction == 'w':  # always even
+            q_shape = (2, 2, 1, 2)
+            s_shape, w_shape = (1, 1, 1), (2, 1, 2)
+        elif compass_direction == 'nw':  # always even
+            q_shape = (2, 2, 1, 1)
+            n_shape, s_shape, w_shape = (2, 1, 2), (1, 1, 1), (1, 1, 1)
+    else:
+        # bulk v-node
+        q_shape = (2, 2, 2, 2)
+        if even_column:
+            n_shape, e_shape, s_shape, w_shape = (2, 2, 2), (2, 1, 2), (2, 2, 2), (2, 1, 2)
+        else:
+            n_shape, e_shape, s_shape, w_shape = (2, 2, 1), (2, 2, 2), (2, 2, 1), (2, 2, 2)
+        # modifications for directions
+        if compass_direction == 'n':
+            q_shape = (1, 2, 2, 2)
+            n_shape, w_shape = (1, 1, 1), (2, 2, 1)
+        elif compass_direction == 'ne':
+            q_shape = (1, 1, 2, 2)
+            n_shape, e_shape, w_shape = (1, 1, 1), (1, 1, 1), (2, 2, 1)
+        elif compass_direction == 'e':
+            q_shape = (2, 1, 2, 2)
+            n_shape, e_shape = (2, 2, 1), (1, 1, 1)
+        elif compass_direction == 'se':  # always odd
+            q_shape = (2, 1, 1, 2)
+            n_shape, e_shape, s_shape = (2, 2, 1), (1, 1, 1), (1, 1, 1)
+        elif compass_direction == 's':  # always odd
+            q_shape = (2, 2, 1, 2)
+            e_shape, s_shape = (2, 2, 1), (1, 1, 1)
+        elif compass_direction == 'sw':  # not possible
+            raise ValueError('Cannot have v-node in SW corner of lattice.')
+        elif compass_direction == 'w':  # always even
+            q_shape = (2, 2, 2, 1)
+            s_shape, w_shape = (2, 2, 1), (1, 1, 1)
+        elif compass_direction == 'nw':  # always even
+            q_shape = (1, 2, 2, 1)
+            n_shape, s_shape, w_shape = (1, 1, 1), (2, 2, 1), (1, 1, 1)
+
+    # derive combined node shape
+    shape = (w_shape[2] * n_shape[1], n_shape[2] * e_shape[1], e_shape[2] * s_shape[1], s_shape[2] * w_shape[1])
+    # derive uncombined node shape and q_node leg indices for iIjJKkLl
+    node_shape = (w_shape[2], n_shape[1], n_shape[2], e_shape[1], s_shape[1], e_shape[2], w_shape[1], s_shape[2])
+    n, e, s, w = np.indices(q_shape, sparse=True)
+    legs = (w, n, n, e, s, e, w, s)
+    node_index = tuple(leg if size > 1 else 0 for leg, size in zip(legs, node_shape))
+    # N.B. for v_node order of nesw is rotated relative to h_node
+    table_axes = (0, 1, 2, 3, 4) if h_node else (0, 4, 1, 2, 3)
+    return _QPlan(even_column, table_axes, q_shape, node_shape, node_index, shape)
+
+
+@functools.lru_cache(maxsize=4096)
+def _q_node(prob_dist, f, h_node, even_column, compass_direction, dtype):
+    """Return q-node for tensor network.
+
+    See :meth:`RotatedPlanarG81RMPSDecoder.TNC.create_q_node` for parameters.
+
+    :param dtype: Data type of q-node.
+    :type dtype: numpy.dtype
+    :return: Q-node for tensor network.
+    :rtype: numpy.array (4d)
+    """
+    return _q_fill(_q_plan(h_node, even_column, compass_direction), prob_dist, f, dtype)
+
+
+def _q_fill(plan, prob_dist, f, dtype):
+    """Return q-node for tensor network created according to the given plan.
+
+    :param plan: Q-node plan.
+    :type plan: _QPlan
+    :param prob_dist: Probability distribution in the format (Pr(I), Pr(X), Pr(Y), Pr(Z)).
+    :type prob_dist: (float, float, float, float)
+    :param f: Pauli operator on qubit as 'I', 'X', 'Y', or 'Z'.
+    :type f: str
+    :param dtype: Data type of q-node.
+    :type dtype: numpy.dtype
+    :return: Q-node for tensor network.
+    :rtype: numpy.array (4d)
+    """
+    # create q_node by slicing values from table (boundary legs of size 1 take the off value)
+    table = _full_table(prob_dist, plan.even_column, dtype).transpose(plan.table_axes)
+    q_shape = plan.q_shape
+    q_node = table['IXYZ'.index(f), :q_shape[0], :q_shape[1], :q_shape[2], :q_shape[3]]
+    # create combined node by absorbing deltas into q_node: nesw -> (iI)(jJ)(Kk)(Ll)
+    # N.B. each non-dummy delta index equals its q_node leg index, so rather than contracting with delta
+    # tensors, q_node values are written directly onto the (diagonal) positions they would occupy.
+    node = np.zeros(plan.node_shape, dtype=q_node.dtype)
+    node[plan.node_index] = q_node
+    node = node.reshape(plan.shape)
+    node.flags.writeable = False
+    # return combined node
+    return node
+
+
+@functools.lru_cache(maxsize=64)
+def _tn_nodes(code, prob_dist, dtype):
+    """Return q-nodes for every Pauli on every site of the tensor network of the given code.
+
+    Notes:
+
+    * Q-nodes are created as in :meth:`qecsim.models.rotatedplanar.RotatedPlanarRMPSDecoder.TNC.create_tn` for each
+      Pauli, so a tensor network for any sample Pauli is a selection from the q-nodes (see
+      :meth:`RotatedPlanarG81RMPSDecoder.TNC.create_tn`).
+
+    :param code: Rotated planar G18 (XZXZ/ZXZX) code.
+    :type code: RotatedPlanarG18Code
+    :param prob_dist: Probability distribution in the format (Pr(I), Pr(X), Pr(Y), Pr(Z)).
+    :type prob_dist: (float, float, float, float)
+    :param dtype: Data type of q-nodes.
+    :type dtype: numpy.dtype
+    :return: Q-nodes indexed by (f, r, c), with f in order I, X, Y, Z and (r, c) the tensor network index.
+    :rtype: numpy.array (3d) of numpy.array (4d)
+    """
+    nodes = np.empty((4,) + code.size, dtype=object)
+    max_site_x, max_site_y = code.site_bounds
+    for code_index in itertools.product(range(max_site_x + 1), range(max_site_y + 1)):
+        x, y = code_index
+        # prepare parameters (see qecsim.models.rotatedplanar.RotatedPlanarRMPSDecoder.TNC.create_tn)
+        is_h_node = code.is_z_plaquette(code_index)
+        q_node_index = (max_site_y - y, x)
+        is_even_column = not (q_node_index[1] % 2)
+        q_direction = {max_site_y: 'n', 0: 's'}.get(y, '') + {0: 'w', max_site_x: 'e'}.get(x, '')
+        for f_index, q_pauli in enumerate('IXYZ'):
+            nodes[(f_index,) + q_node_index] = _q_node(prob_dist, q_pauli, is_h_node, is_even_column, q_direction,
+                                                       dtype)
+    nodes.flags.writeable = False
+    return nodes
+
 
 @cli_description('Rotated MPS ([chi] INT >=0, [mode] CHAR, ...)')
 class RotatedPlanarG81RMPSDecoder(RotatedPlanarRMPSDecoder):
@@ -123,12 +384,66 @@ class RotatedPlanarG81RMPSDecoder(RotatedPlanarRMPSDecoder):
         2 H-V-H
     """
 
+    def __init__(self, chi=None, mode='c', tol=None, dtype=None):
+        """
+        Initialise new rotated planar G18 RMPS decoder.
+
+        Notes:
+
+        * The tensor network is created and contracted in float64 unless float32 is given as dtype.
+        * float32 requires chi to be truthy, so that the MPS is normalised by truncation after each column (otherwise
+          values underflow for large lattices), and tol to be falsy or not finer than float32 resolution.
+        * With float32, if any other coset is within a log probability of 1e-3 of the most probable coset, the coset
+          probabilities are recontracted in float64, so that float32 rounding does not decide between them.
+        * The label includes the dtype if it is not float64, so float32 results are distinguished from float64 results
+          of decoders with the same parameters.
+
+        :param chi: Truncated bond dimension. (default=None, unrestricted=falsy)
+        :type chi: int or None
+        :param mode: Contraction mode. (default='c', 'c'=columns, 'r'=rows, 'a'=average)
+        :type mode: str
+        :param tol: Tolerance for treating normalised singular values as zero. (default=None, unrestricted=falsy)
+        :type tol: float or None
+        :param dtype: Data type of tensor network. (default=None resolves to float64, values=float32, float64)
+        :type dtype: numpy.dtype or str or None
+        :raises ValueError: if chi is not falsy or > 0.
+        :raises ValueError: if mode not in ('c', 'r', 'a').
+        :raises ValueError: if tol is not falsy or > 0.0.
+        :raises ValueError: if dtype is not None, float32 or float64.
+        :raises ValueError: if dtype is float32 and chi is falsy or tol is finer than float32 resolution.
+        :raises TypeError: if any parameter is of an invalid type.
+        """
+        super().__init__(chi=chi, mode=mode, tol=tol)
+        try:  # paranoid checking for CLI.
+            if not (dtype is None or np.dtype(dtype) in (np.float32, np.float64)):
+                raise ValueError('{} valid dtype values are None, float32 or float64'.format(type(self).__name__))
+        except TypeError as ex:
+            raise TypeError('{} invalid parameter type'.format(type(self).__name__)) from ex
+        self._dtype = None if dtype is None else np.dtype(dtype)
+        if self._dtype == np.float32:
+            # N.B. without truncation the MPS is never normalised, so values would underflow in float32 for large
+            # lattices
+            if not self._chi:
+                raise ValueError('{} float32 dtype requires chi'.format(type(self).__name__))
+            if self._tol and self._tol < np.finfo(np.float32).eps:
+                raise ValueError('{} float32 dtype requires tol >= {}'.format(
+                    type(self).__name__, np.finfo(np.float32).eps))
+        self._tnc = self.TNC(dtype=np.float64 if self._dtype is None else self._dtype)
+        # float64 tensor network creator to resolve close float32 coset probabilities
+        self._tnc64 = self._tnc if self._tnc._dtype == np.float64 else self.TNC(dtype=np.float64)
+
+
     @classmethod
     def sample_recovery(cls, code, syndrome):
         """
         Return a sample Pauli consistent with the syndrome, created by applying a path of X or Z operators between each
         plaquette, identified by the syndrome.
 
+        Notes:
+
+        * The sample Pauli is a view of the bsf returned by :meth:`sample_recovery_bsf`, except for an empty syndrome,
+          for which a new identity Pauli is returned.
+
         :param code: Rotated planar G18 (XZXZ/ZXZX) code.
         :type code: RotatedPlanarG18Code
         :param syndrome: Syndrome as binary vector.
@@ -136,60 +451,276 @@ class RotatedPlanarG81RMPSDecoder(RotatedPlanarRMPSDecoder):
         :return: Sample recovery operation as rotated planar pauli.
         :rtype: RotatedPlanarG18Pauli
         """
-        # prepare a new blank sample
-        sample_recovery = code.new_pauli()
-        # ask code for plaquette_indices associated with the non-commuting stabilizers identified by the syndrome
-        plaquette_indices = code.syndrome_to_plaquette_indices(syndrome)
+        # an empty syndrome (the most common case well below threshold) has the identity as sample, which is created
+        # directly rather than from a bsf
+        if not syndrome.any():
+            return code.new_pauli()
+        return code.new_pauli(bsf=cls.sample_recovery_bsf(code, syndrome))
+
+
+    @classmethod
+    def sample_recovery_bsf(cls, code, syndrome):
+        """
+        Return the binary symplectic form of a sample Pauli consistent with the syndrome (see :meth:`sample_recovery`).
+
+        Notes:
+
+        * The path of each plaquette is cached per code as a bit-packed bsf mask in stabilizer order (see
+          :meth:`_sample_recovery_masks`), so the sample is the XOR of the masks selected by the syndrome, reduced
+          64 sites at a time and unpacked into a single new bsf.
+        * A new bsf is returned on every call, including the identity for an empty syndrome, so it may be modified.
+
+        :param code: Rotated planar G18 (XZXZ/ZXZX) code.
+        :type code: RotatedPlanarG18Code
+        :param syndrome: Syndrome as binary vector.
+        :type syndrome: numpy.array (1d)
+        :return: Sample recovery operation in binary symplectic form.
+        :rtype: numpy.array (1d) of uint8
+        """
+        # an empty syndrome has the identity as sample
+        if not syndrome.any():
+            return np.zeros(2 * code.n_k_d[0], dtype=np.uint8)
+        packed_masks = cls._sample_recovery_masks(code)
+        # xor the paths of the plaquettes associated with the non-commuting stabilizers identified by the syndrome
+        packed_bsf = np.bitwise_xor.reduce(packed_masks[np.flatnonzero(syndrome)], axis=0)
+        return np.unpackbits(packed_bsf.view(np.uint8), count=2 * code.n_k_d[0])
+
+
+    @classmethod
+    @functools.lru_cache()
+    def _sample_recovery_masks(cls, code):
+        """
+        Return bit-packed bsf masks of the sample recovery path of each plaquette, in stabilizer order.
+
+        Notes:
+
+        * The paths of all plaquettes are built together, with each site tagged by the stabilizer index of its
+          plaquette, rather than plaquette by plaquette.
+        * Each mask is packed 8 sites per byte by :func:`numpy.packbits`, padded with zeros to a whole number of
+          64-bit words and viewed as uint64, so masks are XORed 64 sites at a time with 1/8 of the memory traffic.
+
+        :param code: Rotated planar G18 (XZXZ/ZXZX) code.
+        :type code: RotatedPlanarG18Code
+        :return: Masks with one row per stabilizer, in bit-packed binary symplectic form, i.e. X mask followed by Z
+            mask.
+        :rtype: numpy.array (2d) of uint64
+        """
+        plaq_xs, plaq_ys = code._plaquette_index_array.T
+        stabilizer_indices = np.arange(len(plaq_xs))
+        # NOTE: plaquette index coincides with the index of the site in its lower left corner
 
         max_site_x, max_site_y = code.site_bounds
-        for plaq_index in plaquette_indices:
-            # NOTE: plaquette index coincides with the index of the site in its lower left corner
-            plaq_x, plaq_y = plaq_index
-
-            # If the diagonal is even counting out from the center diagonal from bottom left to top right
-            if ((plaq_x - plaq_y) % 2 == 0):
-                
-                # Even row => ZX/ZX plaquette
-                if (plaq_y % 2 == 0): 
-
-                    # Add an (X)ZXZ... path from the site at the bottom left corner of the plaquette and left to the boundary
-                    for x in reversed(range(0, plaq_x + 1)):
-                        if (x % 2 == 0):
-                            sample_recovery.site('X', (x, plaq_y))
-                        else:
-                            sample_recovery.site('Z', (x, plaq_y))
-
-                # Odd row => XZ/XZ plaquette
-                else:
+        # If the diagonal is even counting out from the center diagonal from bottom left to top right
+        even_diagonal = (plaq_xs - plaq_ys) % 2 == 0
+
+        # Add an (X)ZXZ... path from the site at the bottom (top) left corner of the plaquette and left to the boundary
+        # for an even (odd) row, i.e. ZX/ZX (XZ/XZ), plaquette
+        row_ys = plaq_ys[even_diagonal] + plaq_ys[even_diagonal] % 2
+        row_lengths = plaq_xs[even_diagonal] + 1
+        xs = np.arange(max_site_x + 1)
+        in_row = xs < row_lengths[:, np.newaxis]
+        row_stabilizers = np.broadcast_to(stabilizer_indices[even_diagonal][:, np.newaxis], in_row.shape)[in_row]
+        row_sites = np.stack(np.broadcast_arrays(xs, row_ys[:, np.newaxis]), axis=-1)[in_row]
+        row_x_ops = row_sites[:, 0] % 2 == 0
+
+        # Add a ZZZ... path from the lower left (right), down to the boundary for an even (odd) column plaquette on an
+        # odd diagonal
+        col_xs = plaq_xs[~even_diagonal] + plaq_xs[~even_diagonal] % 2
+        col_lengths = plaq_ys[~even_diagonal] + 1
+        ys = np.arange(max_site_y + 1)
+        in_col = ys < col_lengths[:, np.newaxis]
+        col_stabilizers = np.broadcast_to(stabilizer_indices[~even_diagonal][:, np.newaxis], in_col.shape)[in_col]
+        col_sites = np.stack(np.broadcast_arrays(col_xs[:, np.newaxis], ys), axis=-1)[in_col]
+
+        # combine paths, keeping only sites within lattice, where row paths apply X (Z) operators on even (odd) columns
+        # and column paths apply Z operators
+        path_stabilizers = np.concatenate((row_stabilizers, col_stabilizers))
+        path_xs, path_ys = np.concatenate((row_sites, col_sites)).T
+        path_x_ops = np.concatenate((row_x_ops, np.zeros(len(col_sites), dtype=bool)))
+        in_bounds = (path_xs <= max_site_x) & (path_ys <= max_site_y)
+        rows, cols = code.size
+        flat_indices = path_xs + path_ys * cols
+        # Z operators are offset by the number of qubits in the bsf
+        bsf_indices = flat_indices + np.where(path_x_ops, 0, rows * cols)
+        masks = np.zeros((len(plaq_xs), 2 * rows * cols), dtype=np.uint8)
+        np.bitwise_xor.at(masks, (path_stabilizers[in_bounds], bsf_indices[in_bounds]), 1)
+        packed_masks = np.packbits(masks, axis=1)
+        packed_masks = np.pad(packed_masks, ((0, 0), (0, -packed_masks.shape[1] % 8))).view(np.uint64)
+        packed_masks.flags.writeable = False
+        return packed_masks
+
+
+    def _log_coset_probabilities(self, tnc, tns, coset_pairs, direction, log_warnings):
+        """
+        Return the natural logarithm of the (approximate) coset probabilities by contracting the given tensor networks
+        column-by-column.
+
+        :param tnc: Tensor network creator used to contract.
+        :type tnc: RotatedPlanarG81RMPSDecoder.TNC
+        :param tns: Tensor networks for cosets (in order I, X, Y, Z).
+        :type tns: list of numpy.array (2d) of numpy.array (4d)
+        :param coset_pairs: Pairs of coset indices that differ only in the last column, where the first of each pair is
+            contracted.
+        :type coset_pairs: 2-tuple of 2-tuple of int
+        :param direction: Contraction direction for log warnings, 'COL' or 'ROW'.
+        :type direction: str
+        :param log_warnings: Log warnings to append to if contraction fails.
+        :type log_warnings: list of str
+        :return: Log coset probabilities (in order I, X, Y, Z), -inf by default.
+        :rtype: list of float
+        """
+        log_coset_ps = [-np.inf, -np.inf, -np.inf, -np.inf]  # default log coset probabilities
+        for contracted, other in coset_pairs:
+            try:
+                bra, log_mult = tnc.contract(tns[contracted], chi=self._chi, tol=self._tol, stop=-1)
+                for coset in (contracted, other):
+                    coset_p = float(tt.mps.inner_product(bra, tns[coset][:, -1]))
+                    # N.B. truncation can leave a tiny negative coset probability, which is treated as zero (as it
+                    # would be ranked below any positive coset probability)
+                    with np.errstate(divide='ignore'):
+                        log_coset_ps[coset] = (np.nan if np.isnan(coset_p) else np.log(max(coset_p, 0.0))) + log_mult
+            except (ValueError, np.linalg.LinAlgError) as ex:
+                log_warnings.append('CONTRACTION BY {} FOR {}/{} COSET FAILED: {!r}'.format(
+                    direction, 'IXYZ'[contracted], 'IXYZ'[other], ex))
+        # treat nan as inf so it doesn't get lost
+        return [np.inf if np.isnan(log_coset_p) else float(log_coset_p) for log_coset_p in log_coset_ps]
+
+
+    def _mode_log_coset_probabilities(self, tnc, prob_dist, sample_paulis, log_warnings):
+        """
+        Return the natural logarithm of the (approximate) coset probabilities by column, by row and as used for the
+        contraction mode.
+
+        :param tnc: Tensor network creator used to create and contract the tensor networks.
+        :type tnc: RotatedPlanarG81RMPSDecoder.TNC
+        :param prob_dist: Tuple of quantized probability distribution in the format (P(I), P(X), P(Y), P(Z)).
+        :type prob_dist: 4-tuple of float
+        :param sample_paulis: Sample Paulis (in order I, X, Y, Z).
+        :type sample_paulis: 4-tuple of RotatedPlanarG81Pauli
+        :param log_warnings: Log warnings to append to if contraction fails.
+        :type log_warnings: list of str
+        :return: Log coset probabilities by column, by row (None if not contracted), for the mode (all in order I, X,
+            Y, Z).
+        :rtype: list of float or None, list of float or None, list of float
+        """
+        # tensor networks: tns are common to both contraction by column and by row (after transposition)
+        tns = [tnc.create_tn(prob_dist, sp) for sp in sample_paulis]
+        # log probabilities
+        log_coset_ps_col = log_coset_ps_row = None  # undefined log coset probabilities by column and row
+        if self._mode in ('c', 'a'):
+            # note: I,Z and X,Y cosets differ only in the last column (logical Z)
+            log_coset_ps_col = self._log_coset_probabilities(tnc, tns, ((0, 3), (1, 2)), 'COL', log_warnings)
+        if self._mode in ('r', 'a'):
+            # transpose tensor networks
+            tns = [tt.mps2d.transpose(tn) for tn in tns]
+            # note: I,X and Z,Y cosets differ only in the last row (logical X)
+            log_coset_ps_row = self._log_coset_probabilities(tnc, tns, ((0, 1), (3, 2)), 'ROW', log_warnings)
+        if self._mode == 'c':
+            log_coset_ps = log_coset_ps_col
+        elif self._mode == 'r':
+            log_coset_ps = log_coset_ps_row
+        else:
+            # average coset probabilities
+            log_coset_ps = [np.logaddexp(col, row) - np.log(2) for col, row in zip(log_coset_ps_col, log_coset_ps_row)]
+        return log_coset_ps_col, log_coset_ps_row, log_coset_ps
+
+
+    def _coset_probabilities(self, prob_dist, sample_pauli):
+        r"""
+        Return the (approximate) probability and sample Pauli for the left coset :math:`fG` of the stabilizer group
+        :math:`G` of the planar code with respect to the given sample Pauli :math:`f`, as well as for the cosets
+        :math:`f\bar{X}G`, :math:`f\bar{Y}G` and :math:`f\bar{Z}G`.
+
+        Notes:
+
+        * Contractions are evaluated in float64, or float32 with a float64 fallback for close cosets (see
+          :meth:`__init__`), with the cumulative norm kept as a logarithm (see :meth:`TNC.contract`), rather than in
+          mpmath.mpf.
+        * The probability distribution is quantized to 12 significant digits before creating the tensor networks, so
+          that cached q-nodes are reused for equal probability distributions (see :func:`_quantize`).
+        * To avoid underflow, coset probabilities are returned relative to the most probable coset, i.e. the most
+          probable coset has probability 1.0. If the most probable coset does not have a finite log probability, coset
+          probabilities are returned unscaled.
+
+        :param prob_dist: Tuple of probability distribution in the format (P(I), P(X), P(Y), P(Z)).
+        :type prob_dist: 4-tuple of float
+        :param sample_pauli: Sample planar Pauli.
+        :type sample_pauli: RotatedPlanarG81Pauli
+        :return: Coset probabilities, Sample Paulis (both in order I, X, Y, Z)
+            E.g. (1.0, 0.5, 0.25, 0.5), (RotatedPlanarG81Pauli(...), ...)
+        :rtype: 4-tuple of float, 4-tuple of RotatedPlanarG81Pauli
+        """
+        # NOTE: all list/tuples in this method are ordered (i, x, y, z)
+        # empty log warnings
+        log_warnings = []
+        # sample paulis
+        sample_paulis = (
+            sample_pauli,
+            sample_pauli.copy().logical_x(),
+            sample_pauli.copy().logical_x().logical_z(),
+            sample_pauli.copy().logical_z()
+        )
+        # log probabilities
+        tn_prob_dist = _quantize(prob_dist)
+        log_coset_ps_col, log_coset_ps_row, log_coset_ps = self._mode_log_coset_probabilities(
+            self._tnc, tn_prob_dist, sample_paulis, log_warnings)
+        if self._tnc is not self._tnc64:
+            # recontract in float64 if float32 rounding could decide the most probable coset
+            first, second = sorted(log_coset_ps, reverse=True)[:2]
+            if not np.isfinite(first) or first - second < _FLOAT32_LOG_GAP:
+                log_warnings.clear()
+                log_coset_ps_col, log_coset_ps_row, log_coset_ps = self._mode_log_coset_probabilities(
+                    self._tnc64, tn_prob_dist, sample_paulis, log_warnings)
+        # scale relative to most probable coset
+        max_log_coset_p = max(log_coset_ps)
+        offset = max_log_coset_p if np.isfinite(max_log_coset_p) else 0.0
+        coset_ps = tuple(float(np.exp(log_coset_p - offset)) for log_coset_p in log_coset_ps)
+        # logging
+        if log_warnings:
+            log_data = {
+                # instance
+                'decoder': repr(self),
+                # method parameters
+                'prob_dist': prob_dist,
+                'sample_pauli': pt.pack(sample_pauli.to_bsf()),
+                # variables
+                'log_coset_ps_col': log_coset_ps_col,
+                'log_coset_ps_row': log_coset_ps_row,
+                'coset_ps': coset_ps,
+            }
+            logger.warning('{}: {}'.format(' | '.join(log_warnings), json.dumps(log_data, sort_keys=True)))
+        # results
+        return coset_ps, sample_paulis
+
+
+    def prepare(self, code, prob_dist):
+        """
+        Create and cache the q-nodes of the tensor networks for the given code and probability distribution, so that
+        subsequent decodes with the same code and probability distribution only select and contract tensor networks.
 
-                    # Add a ZXZX... path from the site at the top left corner of the plaquette and left to the boundary
-                    for x in reversed(range(0, plaq_x + 1)):
-                        if (x % 2 == 0):
-                            sample_recovery.site('X', (x, plaq_y + 1))
-                        else:
-                            sample_recovery.site('Z', (x, plaq_y + 1))
+        Notes:
 
-            # If the diagonal is odd counting out from the center diagonal from bottom left to top right
-            else:
+        * Calling this method is optional; the q-nodes are otherwise created and cached on the first decode.
 
-                # Add a ZZZ... path from the lower left, down to the boundary
-                if (plaq_x % 2 == 0):
-                    for y in range(0, plaq_y + 1):
-                        sample_recovery.site('Z', (plaq_x, y))
+        :param code: Rotated planar G18 (XZXZ/ZXZX) code.
+        :type code: RotatedPlanarG18Code
+        :param prob_dist: Tuple of probability distribution in the format (P(I), P(X), P(Y), P(Z)).
+        :type prob_dist: 4-tuple of float
+        """
+        _tn_nodes(code, _quantize(tuple(prob_dist)), self._tnc._dtype)
 
-                # Add a ZZZ... path from the lower right, down to the boundary
-                else:
-                    for y in range(0, plaq_y + 1):
-                        sample_recovery.site('Z', (plaq_x + 1, y))
 
-        # return sample
-        return sample_recovery
+    def __repr__(self):
+        # N.B. the resolved dtype is given, so that float32 and float64 decoders are distinguished in logs
+        return '{}({!r}, {!r}, {!r}, {!r})'.format(type(self).__name__, self._chi, self._mode, self._tol,
+                                                   self._tnc._dtype.name)
 
 
     @property
     def label(self):
         """See :meth:`qecsim.model.Decoder.label`"""
-        params = [('chi', self._chi), ('mode', self._mode), ('tol', self._tol), ]
+        params = [('chi', self._chi), ('mode', self._mode), ('tol', self._tol),
+                  ('dtype', None if self._tnc._dtype == np.float64 else self._tnc._dtype.name), ]
         return 'Rotated planar G18 (XZXZ/ZXZX) RMPS ({})'.format(', '.join('{}={}'.format(k, v) for k, v in params if v))
 
 
@@ -198,36 +729,207 @@ class RotatedPlanarG81RMPSDecoder(RotatedPlanarRMPSDecoder):
         """Tensor network creator"""
 
 
-        @functools.lru_cache()
-        def h_node_value(self, prob_dist, f, n, e, s, w, even_column):
-            """Return horizontal edge tensor element value."""
-            paulis = ('I', 'X', 'Y', 'Z')
-            op_to_pr = dict(zip(paulis, prob_dist))
-            f = pt.pauli_to_bsf(f)
-            I, X, Y, Z = pt.pauli_to_bsf(paulis)
-
-            # n, e, s, w are in {0, 1} so multiply op to turn on or off
-            if (even_column):
-                op = (f + (n * Z) + (e * X) + (s * Z) + (w * X)) % 2
+        def __init__(self, dtype=np.float64):
+            """
+            Initialise new tensor network creator.
+
+            :param dtype: Data type of tensor network nodes. (default=numpy.float64)
+            :type dtype: numpy.dtype
+            """
+            self._dtype = np.dtype(dtype)
+
+
+        def contract(self, tn, chi=None, tol=None, stop=None):
+            """
+            Return column-by-column partial contraction of tensor network, where each column is an MPS/MPO, with the
+            natural logarithm of the multiplier.
+
+            Notes:
+
+            * This is equivalent to :func:`qecsim.tensortools.mps2d.contract` for a partial contraction from the first
+              column, except that truncation is by :meth:`truncate` and the cumulative norm from the truncation
+              operations is accumulated as a float logarithm rather than as an mpmath.mpf multiplier.
+
+            :param tn: Tensor network whose columns are MPS/MPO.
+            :type tn: numpy.array (2d) of numpy.array (4d)
+            :param chi: Truncated bond dimension. (default=None, unrestricted=None)
+            :type chi: int or None
+            :param tol: Tolerance for treating normalised singular values as zero. (default=None, unrestricted=None)
+            :type tol: float or None
+            :param stop: Stop column index (exclusive) (default=None resolves to number of columns)
+            :type stop: int or None
+            :return: Partially contracted tensor network as MPS/MPO, Log multiplier
+            :rtype: list of numpy.array (4d), float
+            """
+            result, log_mult = None, 0.0
+            for col in range(*slice(None, stop).indices(tn.shape[1])):
+                mps = tn[:, col]
+                if result is None:
+                    result = list(mps)
+                else:
+                    result = self.contract_pairwise(result, mps)
+                    result, log_norm = self.truncate(result, chi=chi, tol=tol)
+                    log_mult += log_norm
+            return result, log_mult
+
+
+        @staticmethod
+        def contract_pairwise(left_mps, right_mps):
+            """
+            Return MPS/MPO evaluated by contracting the tensors of the left and right MPS/MPO pairwise, summing over the
+            E index of each left tensor and the W index of the corresponding right tensor.
+
+            Notes:
+
+            * This is equivalent to :func:`qecsim.tensortools.mps.contract_pairwise` for MPS/MPO without None objects,
+              except that each pair is contracted as a matrix product with transposes and reshapes (as
+              :func:`numpy.tensordot` does), rather than by :func:`numpy.einsum`.
+
+            :param left_mps: Left MPS/MPO.
+            :type left_mps: list of numpy.array (4d)
+            :param right_mps: Right MPS/MPO.
+            :type right_mps: list of numpy.array (4d)
+            :return: Pairwise contracted MPS/MPO.
+            :rtype: list of numpy.array (4d)
+            """
+            assert len(left_mps) == len(right_mps), 'MPS/MPO are different lengths so cannot be contracted pairwise.'
+            result = []
+            for le, ri in zip(left_mps, right_mps):
+                n, e, s, w = le.shape
+                N, E, S, _ = ri.shape
+                # contract left.east with right.west as matrices: (nsw)e,e(NES)->(nsw)(NES)
+                tsr = le.transpose(0, 2, 3, 1).reshape(n * s * w, e) @ ri.transpose(3, 0, 1, 2).reshape(e, N * E * S)
+                # transpose nswNES to nNEsSw and merge indices
+                result.append(tsr.reshape((n, s, w, N, E, S)).transpose(0, 3, 4, 1, 5, 2).reshape((n * N, E, s * S, w)))
+            return result
+
+
+        def truncate(self, mps, chi=None, tol=None):
+            """
+            Return MPS/MPO with truncated bond dimension, with the natural logarithm of the norm.
+
+            Notes:
+
+            * This is equivalent to :func:`qecsim.tensortools.mps.truncate`, except that SVDs use the divide-and-conquer
+              LAPACK driver gesdd (falling back to gesvd), normalised singular values not greater than 1e-14 are
+              discarded, and the norm is accumulated as a float logarithm rather than as an mpmath.mpf product.
+            * If tol is unspecified and the bond dimension is less than or equal to chi, the MPS/MPO is returned
+              unmodified and the log norm is returned as 0.0.
+            * If the MPS/MPO cannot be normalised, zero tensors are returned and the log norm is returned as -inf.
+
+            :param mps: MPS/MPO
+            :type mps: list of numpy.array (4d)
+            :param chi: Truncated bond dimension. (default=None, unrestricted=None)
+            :type chi: int or None
+            :param tol: Tolerance for treating normalised singular values as zero. (default=None, unrestricted=None)
+            :type tol: float or None
+            :return: MPS/MPO with truncated bond dimension, Log norm from putting into left canonical form.
+            :rtype: list of numpy.array (4d), float
+            """
+            if not (tol or (chi and chi < tt.mps.bond_dimension(mps))):
+                return mps, 0.0
+            lcf_mps, log_norm = self._left_canonical_form(mps, qr=True, normalise=True)
+            if log_norm == -np.inf:
+                return lcf_mps, log_norm
+            # N.B. right canonical form is left canonical form of the reversed MPS/MPO
+            rcf_mps, _ = self._left_canonical_form(tt.mps.reverse(lcf_mps), chi=chi, tol=tol)
+            return tt.mps.reverse(rcf_mps), log_norm
+
+
+        @staticmethod
+        def _left_canonical_form(mps, chi=None, tol=None, qr=False, normalise=False):
+            """
+            Return MPS/MPO in left canonical form, with the natural logarithm of the norm.
+
+            Notes:
+
+            * This is equivalent to :func:`qecsim.tensortools.mps.left_canonical_form` for an MPS/MPO without None
+              objects, except as described in :meth:`truncate`.
+            * If chi is specified and tol is unspecified, tensors whose matrix form has rank at most chi are
+              decomposed by QR rather than SVD, since SVD would not truncate them.
+            * If normalise is False, the norm is absorbed into the last tensor.
+
+            :param mps: MPS/MPO
+            :type mps: list of numpy.array (4d)
+            :param chi: Truncated bond dimension. (default=None, unrestricted=None)
+            :type chi: int or None
+            :param tol: Tolerance for treating normalised singular values as zero. (default=None, unrestricted=None)
+            :type tol: float or None
+            :param qr: Use QR decomposition instead of SVD. (Incompatible with chi and tol parameters) (default=False)
+            :type qr: bool
+            :param normalise: Normalise resultant MPS/MPO. (default=False)
+            :type normalise: bool
+            :return: MPS/MPO in left canonical form, Log norm of MPS/MPO.
+            :rtype: list of numpy.array (4d), float
+            """
+            lcf_mps, log_norm = list(mps), 0.0
+            cutoff = max(tol or 0.0, _SVD_CUTOFF)
+            for row in range(len(lcf_mps) - 1):
+                tsr = lcf_mps[row]  # nesw
+                n, e, _, w = tsr.shape
+                # reshape tensor=nesw as matrix=(new)s, copied in Fortran order so that LAPACK can overwrite it
+                tsr_matrix = tsr.transpose(0, 1, 3, 2).reshape(n * e * w, -1)
+                matrix = np.array(tsr_matrix, order='F')
+                # N.B. if the matrix has rank at most chi (and tol is unspecified), then SVD would not truncate, so QR
+                # decomposition is used to orthonormalise instead
+                if qr or (chi and not tol and min(matrix.shape) <= chi):
+                    # decompose matrix into Q=(new)k, R=ks
+                    q, r = sp_linalg.qr(matrix, mode='economic', overwrite_a=True, check_finite=False)
+                    r_norm = np.linalg.norm(r)
+                    if not r_norm:
+                        return tt.mps.zeros_like(mps), -np.inf
+                    log_norm += float(np.log(r_norm))
+                    matrix, carry = q, r / r_norm
+                else:
+                    # decompose matrix into U=(new)k, S=k, V=ks (s is singular values in descending order)
+                    try:
+                        u, s, v = sp_linalg.svd(matrix, full_matrices=False, overwrite_a=True, check_finite=False,
+                                                lapack_driver='gesdd')
+                    except np.linalg.LinAlgError as lae:
+                        logger.warning('SVD by gesdd failed: {!r}. Trying gesvd.'.format(lae))
+                        u, s, v = sp_linalg.svd(tsr_matrix, full_matrices=False, lapack_driver='gesvd')
+                    max_s = s[0]
+                    if not max_s:
+                        return tt.mps.zeros_like(mps), -np.inf
+                    log_norm += float(np.log(max_s))
+                    # discard normalised singular values not greater than cutoff, and retain at most chi
+                    s = (s / max_s)[:np.count_nonzero(s > cutoff * max_s)][:chi or None]
+                    matrix, carry = u[:, :len(s)], s[:, np.newaxis] * v[:len(s), :]
+                # contract carry=ks into next_tensor=nesw
+                next_tsr = lcf_mps[row + 1]
+                lcf_mps[row + 1] = (carry @ next_tsr.reshape(next_tsr.shape[0], -1)).reshape(
+                    (carry.shape[0],) + next_tsr.shape[1:])
+                # reshape matrix=(new)s as tensor=nesw and update mps
+                lcf_mps[row] = matrix.reshape((n, e, w, matrix.shape[1])).transpose(0, 1, 3, 2)
+            if normalise:
+                last_norm = np.linalg.norm(lcf_mps[-1])
+                if not last_norm:
+                    return tt.mps.zeros_like(mps), -np.inf
+                lcf_mps[-1] = lcf_mps[-1] / last_norm
+                log_norm += float(np.log(last_norm))
             else:
-                op = (f + (n * X) + (e * Z) + (s * X) + (w * Z)) % 2
+                lcf_mps[-1] = lcf_mps[-1] * np.exp(log_norm)
+            return lcf_mps, log_norm
 
-            return op_to_pr[pt.bsf_to_pauli(op)]
+
+        def h_node_value(self, prob_dist, f, n, e, s, w, even_column):
+            """Return horizontal edge tensor element value."""
+            return _full_table(prob_dist, even_column, self._dtype)['IXYZ'.index(f), n, e, s, w]
 
 
-        @functools.lru_cache()
         def v_node_value(self, prob_dist, f, n, e, s, w, even_column):
             """Return vertical edge tensor element value."""
-            # N.B. for v_node order of nesw is rotated relative to h_node
-            return self.h_node_value(prob_dist, f, e, s, w, n, even_column)
+            # N.B. for v_node order of nesw is rotated relative to h_node (indexed directly, not via h_node_value)
+            return _full_table(prob_dist, even_column, self._dtype)['IXYZ'.index(f), e, s, w, n]
 
 
-        @functools.lru_cache(maxsize=256)
         def create_q_node(self, prob_dist, f, h_node, even_column, compass_direction=None):
             """Create q-node for tensor network.
 
             Notes:
 
+            * Q-nodes are cached at module level, keyed only by their arguments and data type, so they are shared by all
+              decoder instances (see :func:`_q_node`).
             * H-nodes have Z-plaquettes above and below (i.e. in NE and SW directions).
             * V-nodes have Z-plaquettes on either side (i.e. in NW and SE directions).
             * Columns are considered even/odd according to indexing defined in :class:`RotatedPlanarCode`.
@@ -245,109 +947,30 @@ class RotatedPlanarG81RMPSDecoder(RotatedPlanarRMPSDecoder):
             :return: Q-node for tensor network.
             :rtype: numpy.array (4d)
             """
+            return _q_node(prob_dist, f, h_node, even_column, compass_direction, self._dtype)
 
-            # H indicates h-node with shape (n,e,s,w).
-            # * indicates delta nodes with shapes (n,I,j), (e,J,k), (s,K,l), (w,L,i) for n-, e-, s-, and w-deltas
-            #   respectively.
-            # n,e,s,w,i,j,k,I,J,K are bond labels
-            #
-            #   i     I
-            #   |     |
-            # L-*     *-j
-            #    \   /
-            #    w\ /n
-            #      H
-            #    s/ \e
-            #    /   \
-            # l-*     *-J
-            #   |     |
-            #   K     k
-            #
-            # Deltas are absorbed into h-node over n,e,s,w legs and reshaped as follows:
-            # nesw -> (iI)(jJ)(Kk)(Ll)
-
-            # define shapes # q_node:(n, e, s, w); delta_nodes: n:(n,I,j), e:(e,J,k), s:(s,K,l), w:(w,L,i)
-            if h_node:
-                # bulk h-node
-                q_shape = (2, 2, 2, 2)
-                if even_column:
-                    n_shape, e_shape, s_shape, w_shape = (2, 2, 2), (2, 1, 2), (2, 2, 2), (2, 1, 2)
-                else:
-                    n_shape, e_shape, s_shape, w_shape = (2, 2, 1), (2, 2, 2), (2, 2, 1), (2, 2, 2)
-                # modifications for directions
-                if compass_direction == 'n':
-                    q_shape = (2, 2, 2, 1)
-                    n_shape, w_shape = (2, 1, 2), (1, 1, 1)
-                elif compass_direction == 'ne':
-                    q_shape = (1, 2, 2, 1)
-                    n_shape, e_shape, w_shape = (1, 1, 1), (2, 1, 2), (1, 1, 1)
-                elif compass_direction == 'e':
-                    q_shape = (1, 2, 2, 2)
-                    n_shape, e_shape = (1, 1, 1), (2, 1, 2)
-                elif compass_direction == 'se':  # always even
-                    q_shape = (1, 1, 2, 2)
-                    n_shape, e_shape, s_shape = (1, 1, 1), (1, 1, 1), (2, 1, 2)
-                elif compass_direction == 's':  # always even
-                    q_shape = (2, 1, 2, 2)
-                    e_shape, s_shape = (1, 1, 1), (2, 1, 2)
-                elif compass_direction == 'sw':  # always even
-                    q_shape = (2, 1, 1, 2)
-                    e_shape, s_shape, w_shape = (1, 1, 1), (1, 1, 1), (2, 1, 2)
-                elif compass_direction == 'w':  # always even
-                    q_shape = (2, 2, 1, 2)
-                    s_shape, w_shape = (1, 1, 1), (2, 1, 2)
-                elif compass_direction == 'nw':  # always even
-                    q_shape = (2, 2, 1, 1)
-                    n_shape, s_shape, w_shape = (2, 1, 2), (1, 1, 1), (1, 1, 1)
-            else:
-                # bulk v-node
-                q_shape = (2, 2, 2, 2)
-                if even_column:
-                    n_shape, e_shape, s_shape, w_shape = (2, 2, 2), (2, 1, 2), (2, 2, 2), (2, 1, 2)
-                else:
-                    n_shape, e_shape, s_shape, w_shape = (2, 2, 1), (2, 2, 2), (2, 2, 1), (2, 2, 2)
-                # modifications for directions
-                if compass_direction == 'n':
-                    q_shape = (1, 2, 2, 2)
-                    n_shape, w_shape = (1, 1, 1), (2, 2, 1)
-                elif compass_direction == 'ne':
-                    q_shape = (1, 1, 2, 2)
-                    n_shape, e_shape, w_shape = (1, 1, 1), (1, 1, 1), (2, 2, 1)
-                elif compass_direction == 'e':
-                    q_shape = (2, 1, 2, 2)
-                    n_shape, e_shape = (2, 2, 1), (1, 1, 1)
-                elif compass_direction == 'se':  # always odd
-                    q_shape = (2, 1, 1, 2)
-                    n_shape, e_shape, s_shape = (2, 2, 1), (1, 1, 1), (1, 1, 1)
-                elif compass_direction == 's':  # always odd
-                    q_shape = (2, 2, 1, 2)
-                    e_shape, s_shape = (2, 2, 1), (1, 1, 1)
-                elif compass_direction == 'sw':  # not possible
-                    raise ValueError('Cannot have v-node in SW corner of lattice.')
-                elif compass_direction == 'w':  # always even
-                    q_shape = (2, 2, 2, 1)
-                    s_shape, w_shape = (2, 2, 1), (1, 1, 1)
-                elif compass_direction == 'nw':  # always even
-                    q_shape = (1, 2, 2, 1)
-                    n_shape, s_shape, w_shape = (1, 1, 1), (2, 2, 1), (1, 1, 1)
-
-            # create deltas
-            n_delta = tt.tsr.delta(n_shape)
-            e_delta = tt.tsr.delta(e_shape)
-            s_delta = tt.tsr.delta(s_shape)
-            w_delta = tt.tsr.delta(w_shape)
-            # create q_node and fill values
-            q_node = np.empty(q_shape, dtype=np.float64)
-            for n, e, s, w in np.ndindex(q_node.shape):
-                if h_node:
-                    q_node[(n, e, s, w)] = self.h_node_value(prob_dist, f, n, e, s, w, even_column)
-                else:
-                    q_node[(n, e, s, w)] = self.v_node_value(prob_dist, f, n, e, s, w, even_column)
-            # derive combined node shape
-            shape = (w_shape[2] * n_shape[1], n_shape[2] * e_shape[1], e_shape[2] * s_shape[1], s_shape[2] * w_shape[1])
-            # create combined node by absorbing deltas into q_node: nesw -> (iI)(jJ)(Kk)(Ll)
-            node = np.einsum('nesw,nIj,eJk,sKl,wLi->iIjJKkLl', q_node, n_delta, e_delta, s_delta, w_delta).reshape(
-                shape)
-            # return combined node
-            return node
 
+        def create_tn(self, prob_dist, sample_pauli):
+            """Return a network (numpy.array 2d) of tensors (numpy.array 4d).
+
+            Notes:
+
+            * The network contracts to the coset probability of the given sample_pauli.
+            * The network is selected, by the Pauli on each site, from the q-nodes cached per code and probability
+              distribution (see :func:`_tn_nodes`), rather than created site by site.
+
+            :param prob_dist: Probability distribution in the format (Pr(I), Pr(X), Pr(Y), Pr(Z)).
+            :type prob_dist: (float, float, float, float)
+            :param sample_pauli: Sample planar Pauli.
+            :type sample_pauli: RotatedPlanarG81Pauli
+            :return: Tensor network.
+            :rtype: numpy.array (2d) of numpy.array (4d)
+            """
+            code = sample_pauli.code
+            nodes = _tn_nodes(code, prob_dist, self._dtype)
+            # index of Pauli on each site in order I, X, Y, Z (by bsf (x, z)), flipped so that rows run from the top
+            pauli_index = np.array([[0, 3], [1, 2]])
+            # N.B. bsf components are cast to integer indices, as e.g. a bool-backed Pauli would be a boolean mask
+            xs, zs = sample_pauli._xs.astype(np.intp), sample_pauli._zs.astype(np.intp)
+            f_indices = pauli_index[xs, zs].reshape(code.size)[::-1]
+            return np.take_along_axis(nodes, f_indices[np.newaxis], axis=0)[0]
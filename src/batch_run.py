@@ -0,0 +1,197 @@
+import multiprocessing
+import statistics
+import time
+
+import numpy as np
+
+from qecsim import app
+from qecsim.models.generic import BiasedDepolarizingErrorModel
+
+
+class BatchedBiasedDepolarizingErrorModel(BiasedDepolarizingErrorModel):
+    """
+    Implements a biased-depolarizing error model that draws the errors for many runs at once.
+
+    Notes:
+
+    * Uniforms for batch_size runs are drawn from the given random number generator in one call and converted to errors
+      by comparison with the cumulative probability distribution. Each call to :meth:`generate` returns the next error
+      in the batch.
+    * A new batch is drawn when the batch is exhausted or when :meth:`generate` is called with a different random
+      number generator, number of qubits or probability. Errors are therefore reproducible for a seeded random number
+      generator, although they differ from those of :class:`qecsim.models.generic.BiasedDepolarizingErrorModel`.
+    * A random number generator that differs from that of the previous call (including rng=None) draws a batch of a
+      single error, and full batches are only drawn once it is reused. So there is no benefit, but little cost, where a
+      new random number generator is used per run, e.g. :func:`qecsim.app.run_once` or :func:`parallel_run`.
+    * The label is that of :class:`qecsim.models.generic.BiasedDepolarizingErrorModel`, so saved results are unchanged.
+    """
+
+    # bsf (x, z) components of paulis in order I, X, Y, Z
+    _PAULI_XS = np.array([0, 1, 1, 0])
+    _PAULI_ZS = np.array([0, 0, 1, 1])
+
+    def __init__(self, bias, axis='Y', batch_size=1024):
+        """
+        Initialise new batched biased-depolarizing error model.
+
+        :param bias: Bias in favour of axis errors relative to off-axis errors.
+        :type bias: float
+        :param axis: Axis towards which the noise is biased. (default='Y', values='X', 'Y', 'Z')
+        :type axis: str
+        :param batch_size: Number of errors drawn at once. (default=1024)
+        :type batch_size: int
+        """
+        super().__init__(bias, axis)
+        self._batch_size = batch_size
+        self._batch_key = None
+        self._batch_rng = None
+        self._batch = np.empty((0, 0), dtype=int)
+        self._batch_index = 0
+
+    def generate(self, code, probability, rng=None):
+        """See :meth:`qecsim.model.ErrorModel.generate`"""
+        rng = np.random.default_rng() if rng is None else rng
+        n_qubits = code.n_k_d[0]
+        batch_key = (n_qubits, probability)
+        # N.B. the batch holds a reference to rng, so rng is compared by identity
+        if self._batch_key != batch_key or self._batch_rng is not rng or self._batch_index == len(self._batch):
+            # a new rng may only be used once, so draw a single error until it is reused
+            batch_size = self._batch_size if self._batch_rng is rng else 1
+            p_i, p_x, p_y, p_z = self.probability_distribution(probability)
+            uniforms = rng.random((batch_size, n_qubits))
+            paulis = np.searchsorted(np.cumsum((p_i, p_x, p_y)), uniforms, side='right')  # indices in order I, X, Y, Z
+            self._batch = np.concatenate((self._PAULI_XS[paulis], self._PAULI_ZS[paulis]), axis=1)
+            self._batch_key, self._batch_rng, self._batch_index = batch_key, rng, 0
+        error = self._batch[self._batch_index].copy()
+        self._batch_index += 1
+        return error
+
+
+def batch_run(code, decoder, params_list, max_runs, random_seed=None, axis='Z'):
+    """
+    Run simulations for each (eta, error probability) in the given list with the same code and decoder, and return
+    the results as a list of dictionaries (in order).
+
+    Notes:
+
+    * The decoder caches (e.g. q-node plans, value tables and tensor network nodes) are module-level and keyed by code
+      and probability distribution, so they are built once and reused by every run with the same code and
+      (eta, error probability).
+    * The decoder is prepared for each (eta, error probability) before its runs, so that each run only selects and
+      contracts tensor networks (see :meth:`RotatedPlanarG81RMPSDecoder.prepare`).
+    * A batched biased-depolarizing error model with bias eta along the given axis is created for each (eta, error
+      probability) (see :class:`BatchedBiasedDepolarizingErrorModel`).
+    * The random seed of each run is drawn from a single random number generator, so a seeded batch is reproducible.
+
+    :param code: Rotated planar G18 code.
+    :type code: RotatedPlanarG81Code
+    :param decoder: Decoder.
+    :type decoder: RotatedPlanarG81RMPSDecoder
+    :param params_list: List of (eta, error probability).
+    :type params_list: list of (float, float)
+    :param max_runs: Maximum number of runs for each (eta, error probability).
+    :type max_runs: int
+    :param random_seed: Random seed for the batch. (default=None, unseeded=None)
+    :type random_seed: int or None
+    :param axis: Axis towards which the noise is biased. (default='Z', values='X', 'Y', 'Z')
+    :type axis: str
+    :return: Aggregated runs data for each (eta, error probability) (see :func:`qecsim.app.run`).
+    :rtype: list of dict
+    """
+    rng = np.random.default_rng(random_seed)
+    data = []
+    for eta, error_probability in params_list:
+        error_model = BatchedBiasedDepolarizingErrorModel(bias=eta, axis=axis)
+        decoder.prepare(code, error_model.probability_distribution(error_probability))
+        run_seed = int(rng.integers(2 ** 32))
+        data.append(app.run(code, error_model, decoder, error_probability, max_runs=max_runs, random_seed=run_seed))
+    return data
+
+
+# code, error model, decoder and error probability shared by the shots of parallel_run in each worker process
+_shot_args = None
+
+
+def _init_shot_worker(code, error_model, decoder, error_probability):
+    global _shot_args
+    _shot_args = (code, error_model, decoder, error_probability)
+
+
+def _one_shot(seed_sequence):
+    code, error_model, decoder, error_probability = _shot_args
+    data = app.run_once(code, error_model, decoder, error_probability, rng=np.random.default_rng(seed_sequence))
+    return data['success'], data['error_weight'], data['logical_commutations'], data['custom_values']
+
+
+def parallel_run(code, error_model, decoder, error_probability, max_runs, n_workers=None, random_seed=None):
+    """
+    Run max_runs simulations in parallel over a pool of worker processes, and return the results aggregated as by
+    :func:`qecsim.app.run`.
+
+    Notes:
+
+    * The decoder is prepared in the parent process before the pool is created, so that on Linux (fork) the workers
+      inherit the tensor network caches copy-on-write instead of each building them (see
+      :meth:`RotatedPlanarG81RMPSDecoder.prepare`).
+    * Each run (shot) has its own random seed spawned from a single seed sequence, so a seeded run is reproducible
+      for any number of workers, although it differs from :func:`qecsim.app.run` with the same seed.
+    * The wall time is that of the parent process.
+    * The bias and axis of the noise are those of the given error model, which is used as is by every shot.
+    * Each shot uses a new random number generator, so :class:`BatchedBiasedDepolarizingErrorModel` brings no benefit
+      here over the error model it extends.
+
+    :param code: Rotated planar G18 code.
+    :type code: RotatedPlanarG81Code
+    :param error_model: Error model.
+    :type error_model: ErrorModel
+    :param decoder: Decoder.
+    :type decoder: RotatedPlanarG81RMPSDecoder
+    :param error_probability: Error probability.
+    :type error_probability: float
+    :param max_runs: Number of runs.
+    :type max_runs: int
+    :param n_workers: Number of worker processes. (default=None, all CPUs=None)
+    :type n_workers: int or None
+    :param random_seed: Random seed. (default=None, unseeded=None)
+    :type random_seed: int or None
+    :return: Aggregated runs data (see :func:`qecsim.app.run`).
+    :rtype: dict
+    """
+    wall_time_start = time.perf_counter()
+    decoder.prepare(code, error_model.probability_distribution(error_probability))
+    n_workers = n_workers or multiprocessing.cpu_count()
+    seed_sequences = np.random.SeedSequence(random_seed).spawn(max_runs)
+    chunksize = max(1, max_runs // (4 * n_workers))
+
+    n_success, error_weights, logical_commutations, custom_values = 0, [], [], []
+    with multiprocessing.Pool(n_workers, _init_shot_worker, (code, error_model, decoder, error_probability)) as pool:
+        for success, error_weight, commutations, values in pool.imap_unordered(_one_shot, seed_sequences, chunksize):
+            n_success += bool(success)
+            error_weights.append(error_weight)
+            logical_commutations.append(commutations)
+            custom_values.append(values)
+
+    def _total(values):
+        # as qecsim.app.run, sums of arrays are tuples, or None if the values are None
+        return None if values[0] is None else tuple(np.sum(values, axis=0).tolist())
+
+    runs_data = {
+        'code': code.label,
+        'n_k_d': code.n_k_d,
+        'time_steps': 1,
+        'error_model': error_model.label,
+        'decoder': decoder.label,
+        'error_probability': error_probability,
+        'measurement_error_probability': 0.0,
+        'n_run': max_runs,
+        'n_success': n_success,
+        'n_fail': max_runs - n_success,
+        'n_logical_commutations': _total(logical_commutations),
+        'custom_totals': _total(custom_values),
+        'error_weight_total': sum(error_weights),
+        'error_weight_pvar': statistics.pvariance(error_weights),
+    }
+    runs_data['logical_failure_rate'] = runs_data['n_fail'] / max_runs
+    runs_data['physical_error_rate'] = runs_data['error_weight_total'] / code.n_k_d[0] / max_runs
+    runs_data['wall_time'] = time.perf_counter() - wall_time_start
+    return runs_data
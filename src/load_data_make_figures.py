@@ -1,5 +1,10 @@
 ### Initial imports
-import json
+import sys
+
+import orjson
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # figures are only saved, so no display is needed
 import matplotlib.pyplot as plt
 
 
@@ -12,12 +17,12 @@ import matplotlib.pyplot as plt
 
 ### Load data
 
-file_name = "example_data.json"
+# data file written by run_sweep.py or run_and_save_data.py, given as an optional argument
+file_name = sys.argv[1] if len(sys.argv) > 1 else "example_data.json"
 data = []
 
-with open(file_name, "r", encoding="utf-8") as file:
-    for line in file:
-        data.append(json.loads(line.removesuffix('\n')))
+with open(file_name, "rb") as file:
+    data.extend(orjson.loads(line) for line in file.read().split(b"\n") if line)
 
 
 ### Perform analysis and plots
@@ -30,9 +35,11 @@ decoder = data[0]['decoder']
 
 # prepare xy_map for plotting each code performance, with x = physical error rate and y = logical error rate. 
 
+# codes are keyed by (distance, label), so that sorted keys give a stable legend order by distance
+
 xy_map = {}
 for run in data:
-    xys = xy_map.setdefault(run['code'], [])
+    xys = xy_map.setdefault((run['n_k_d'][2], run['code']), [])
     xys.append((run['physical_error_rate'], run['logical_failure_rate']))
 
 # format plot
@@ -46,9 +53,11 @@ plt.xlabel('Physical error rate')
 plt.ylabel('Logical failure rate')
 plt.xlim(error_probability_min-0.05, error_probability_max+0.05)
 plt.ylim(-0.05, 0.65)
-# add data
-for code, xys in xy_map.items():
-    plt.plot(*zip(*xys), 'x-', label='{} code'.format(code))
+# add data, sorted by x so that each line is monotone in x
+for (distance, code), xys in sorted(xy_map.items()):
+    xys = np.asarray(xys)
+    xys = xys[np.argsort(xys[:, 0], kind='stable')]
+    plt.plot(xys[:, 0], xys[:, 1], 'x-', label='{} code'.format(code))
 plt.legend(loc='upper left')
 plt.savefig("test.png")
 
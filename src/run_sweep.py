@@ -0,0 +1,80 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import collections
+import itertools
+import orjson
+
+from qecsim import paulitools as pt
+from qecsim.models.generic import DepolarizingErrorModel, BiasedDepolarizingErrorModel
+from qecsim.models.rotatedplanar import RotatedPlanarCode
+from qecsim.models.rotatedplanar import RotatedPlanarRMPSDecoder
+
+from qecsim import app
+
+import RotatedPlanarG81Code as G81Code
+import RotatedPlanarG81Pauli as G81Pauli
+import RotatedPlanarG81RMPSDecoder as G81RMPSDecoder
+
+
+my_code = G81Code.RotatedPlanarG81Code(3)
+my_error_model = DepolarizingErrorModel()
+my_decoder = G81RMPSDecoder.RotatedPlanarG81RMPSDecoder(chi=8)
+
+#print(app.run_once(my_code, my_error_model, my_decoder, 0.2))
+
+#print(app.run_once(RotatedPlanarCode(3, 3), my_error_model, RotatedPlanarRMPSDecoder(chi=8), 0.2))
+
+
+def _run_one(params):
+    """Run simulations for one (code, error model, decoder, error probability, max runs, random seed) and return the
+    result as a dictionary."""
+    code, error_model, decoder, error_probability, max_runs, random_seed = params
+    return app.run(code, error_model, decoder, error_probability, max_runs=max_runs, random_seed=random_seed)
+
+
+# Multiple runs 
+
+codes = [G81Code.RotatedPlanarG81Code(d) for d in [3, 5, 7, 9]]
+error_model = BiasedDepolarizingErrorModel(bias=30, axis='Z')
+decoder = G81RMPSDecoder.RotatedPlanarG81RMPSDecoder(chi=8)
+
+# Physical error
+error_probability_min, error_probability_max = (0, 0.5)
+error_probabilities = np.linspace(error_probability_min, error_probability_max, 10)
+
+# Set max runs for each probability
+max_runs = 100
+
+# Set random seed, from which each (code, probability) run is seeded for reproducibility
+random_seed = 20
+
+# Data file, read by load_data_make_figures.py
+file_name = "sweep_data.json"
+
+
+if __name__ == '__main__':
+
+    # Print run parameters
+    print('Codes:', [code.label for code in codes])
+    print('Error model:', error_model.label)
+    print('Decoder:', decoder.label)
+    print('Error probabilities:', error_probabilities)
+    print('Maximum runs:', max_runs)
+
+
+    # run simulations in parallel over (code, probability) and print data from middle run to view format
+    params = [(code, error_model, decoder, error_probability, max_runs, random_seed + i)
+              for i, (code, error_probability) in enumerate(itertools.product(codes, error_probabilities))]
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        data = list(executor.map(_run_one, params))
+    print(data[len(data)//2])
+
+
+    ### Save data to file in json format, one run per line, for plotting with load_data_make_figures.py
+
+    with open(file_name, "wb") as file:
+        for entry in data:
+            file.write(orjson.dumps(entry, option=orjson.OPT_SERIALIZE_NUMPY))
+            file.write(b"\n")